@@ -0,0 +1,108 @@
+import gi
+import time
+import argparse
+
+gi.require_version("Gst", "1.0")
+from gi.repository import Gst
+
+Gst.init(None)
+
+BACKENDS = ["hull", "mediapipe"]
+CAPS = "video/x-raw,format=RGB,width=640,height=480"
+TIMEOUT = 30 * Gst.SECOND
+
+
+def build_pipeline(backend, args):
+    if args.file:
+        source = (
+            f"filesrc location={args.file} ! decodebin ! "
+            f"videoconvert ! videoscale ! {CAPS}"
+        )
+    else:
+        source = (
+            f"videotestsrc num-buffers={args.num_buffers} pattern={args.pattern} ! "
+            f"videoconvert ! {CAPS}"
+        )
+    return (
+        f"{source} ! gesture_recognizer name=gr backend={backend} "
+        f"segmenter={args.segmenter} cooldown=0 ! fakesink sync=false"
+    )
+
+def print_error(msg):
+    if msg:
+        err, debug = msg.parse_error()
+        print(f"GStreamer Error: {err.message}")
+        print(f"Debug Info: {debug}")
+
+def run(backend, args):
+    pipeline_str = build_pipeline(backend, args)
+    print(f"\ngst-launch-1.0 {pipeline_str}")
+    pipeline = Gst.parse_launch(pipeline_str)
+    bus = pipeline.get_bus()
+
+    gestures = 0
+    try:
+        ret = pipeline.set_state(Gst.State.PLAYING)
+        if ret != Gst.StateChangeReturn.FAILURE:
+            # Backends load their model in start(); wait that out so fps is per-frame cost only
+            ret, _, _ = pipeline.get_state(TIMEOUT)
+        if ret not in (Gst.StateChangeReturn.SUCCESS, Gst.StateChangeReturn.NO_PREROLL):
+            print("ERROR: Unable to set the pipeline to the playing state.")
+            print_error(bus.pop_filtered(Gst.MessageType.ERROR))
+            return None
+
+        start = time.perf_counter()
+        while True:
+            msg = bus.timed_pop_filtered(
+                TIMEOUT,
+                Gst.MessageType.EOS | Gst.MessageType.ERROR | Gst.MessageType.ELEMENT,
+            )
+            if msg is None:
+                print(f"ERROR: No EOS within {TIMEOUT // Gst.SECOND} s.")
+                return None
+            if msg.type == Gst.MessageType.ERROR:
+                print_error(msg)
+                return None
+            if msg.type == Gst.MessageType.EOS:
+                break
+            s = msg.get_structure()
+            if s and s.get_name() == "gesture":
+                gestures += 1
+        wall = time.perf_counter() - start
+
+        # Read the counters before the pipeline (and the element) is torn down
+        stats_str = pipeline.get_by_name("gr").get_property("stats")
+    finally:
+        pipeline.set_state(Gst.State.NULL)
+
+    stats = Gst.Structure.new_from_string(stats_str)
+    return {
+        "backend": backend,
+        "frames": stats.get_value("frames"),
+        "detections": stats.get_value("detections"),
+        "gestures": gestures,
+        "load_ms": stats.get_value("load_ms"),
+        "mean_ms": stats.get_value("mean_ms"),
+        "fps": stats.get_value("frames") / wall if wall > 0 else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare gesture_recognizer backends in a GStreamer pipeline")
+    parser.add_argument("--file", help="recorded clip played through filesrc instead of videotestsrc")
+    parser.add_argument("--num-buffers", type=int, default=300)
+    parser.add_argument("--pattern", default="ball", help="videotestsrc pattern")
+    parser.add_argument("--segmenter", default="otsu", help="segmenter used by the hull backend")
+    parser.add_argument("--backends", nargs="+", default=BACKENDS)
+    args = parser.parse_args()
+
+    results = [r for r in (run(b, args) for b in args.backends) if r]
+
+    print(f"\n{'backend':>10} {'frames':>7} {'load ms':>9} {'mean ms':>9} {'fps':>7} {'detect':>7} {'gestures':>9}")
+    for r in results:
+        print(f"{r['backend']:>10} {r['frames']:>7} {r['load_ms']:>9.1f} {r['mean_ms']:>9.2f} "
+              f"{r['fps']:>7.1f} {r['detections']:>7} {r['gestures']:>9}")
+
+
+if __name__ == "__main__":
+    main()
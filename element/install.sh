@@ -5,7 +5,7 @@ PLUGIN_DIR="$HOME/.gstreamer-1.0/plugins/python"
 
 mkdir -p "$PLUGIN_DIR"
 rm -rf "$PLUGIN_DIR"/*
-cp plugin/gesture_recognizer.py "$PLUGIN_DIR/"
+cp plugin/gesture_recognizer.py plugin/hand_segmentation.py plugin/gesture_backends.py "$PLUGIN_DIR/"
 
 # Clear GStreamer's "Failure Cache"
 rm -rf ~/.cache/gstreamer-1.0
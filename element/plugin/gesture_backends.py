@@ -0,0 +1,150 @@
+import time
+
+from hand_segmentation import SEGMENTERS, load_skin_lut, gesture_from_mask
+
+# Every backend reports in the same ID space, keyed by extended fingers:
+# 0 = no hand, 1 = fist (or a single finger), 2..5 = that many fingers.
+# This is what the convex hull can tell apart, so MediaPipe is folded into it;
+# the standalone MediaPipe app's OK sign (6) has no equivalent here.
+GESTURE_NAMES = {
+    1: "Fist",
+    2: "Two fingers",
+    3: "Three fingers",
+    4: "Four fingers",
+    5: "Open Palm",
+}
+
+
+def gesture_from_finger_count(count):
+    if count <= 1:
+        return 1
+    return min(count, 5)
+
+
+class GestureBackend:
+    name = ""
+
+    def __init__(self):
+        self.loaded = False
+        self.load_ms = 0.0
+        self.frames = 0
+        self.detections = 0
+        self.total_ms = 0.0
+
+    def load(self):
+        # Models are only pulled in on first use, so an unused backend costs nothing
+        if self.loaded:
+            return
+        # Each start is reported as its own run, not summed with earlier ones
+        self.frames = 0
+        self.detections = 0
+        self.total_ms = 0.0
+        start = time.perf_counter()
+        self._load()
+        self.load_ms = (time.perf_counter() - start) * 1000
+        self.loaded = True
+
+    def process(self, frame):
+        self.load()
+        start = time.perf_counter()
+        gesture_id = self._process(frame)
+        self.total_ms += (time.perf_counter() - start) * 1000
+        self.frames += 1
+        if gesture_id > 0:
+            self.detections += 1
+        return gesture_id
+
+    def close(self):
+        if self.loaded:
+            self._close()
+            self.loaded = False
+
+    def stats(self):
+        return {
+            "backend": self.name,
+            "frames": self.frames,
+            "detections": self.detections,
+            "load_ms": round(self.load_ms, 3),
+            "mean_ms": round(self.total_ms / self.frames, 3) if self.frames else 0.0,
+        }
+
+    def _load(self):
+        pass
+
+    def _process(self, frame):
+        raise NotImplementedError
+
+    def _close(self):
+        pass
+
+
+class HullBackend(GestureBackend):
+    name = "hull"
+
+    def __init__(self, segmenter="otsu"):
+        super().__init__()
+        self.segmenter = segmenter
+
+    def _load(self):
+        if self.segmenter == "skin-lut":
+            load_skin_lut()
+
+    def _process(self, frame):
+        mask = SEGMENTERS[self.segmenter](frame)
+        return gesture_from_mask(mask)
+
+
+class MediaPipeBackend(GestureBackend):
+    name = "mediapipe"
+
+    def __init__(self):
+        super().__init__()
+        self._hands = None
+        self._landmark = None
+
+    def _load(self):
+        # Imported here so the hull backend works without mediapipe installed
+        import mediapipe as mp
+
+        self._landmark = mp.solutions.hands.HandLandmark
+        self._hands = mp.solutions.hands.Hands(
+            model_complexity=1,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5,
+            max_num_hands=1
+        )
+
+    def _process(self, frame):
+        # The element maps the buffer read-only in passthrough mode; a
+        # non-writeable array lets MediaPipe take it by reference
+        frame.flags.writeable = False
+        results = self._hands.process(frame)
+        if not results.multi_hand_landmarks:
+            return 0
+        return self._gesture_from_landmarks(results.multi_hand_landmarks[0])
+
+    def _gesture_from_landmarks(self, hand_landmarks):
+        lm = hand_landmarks.landmark
+        hl = self._landmark
+
+        def is_finger_extended(tip, pip):
+            return lm[tip].y < lm[pip].y
+
+        fingers_extended = [
+            lm[hl.THUMB_TIP].x < lm[hl.THUMB_IP].x,
+            is_finger_extended(hl.INDEX_FINGER_TIP, hl.INDEX_FINGER_PIP),
+            is_finger_extended(hl.MIDDLE_FINGER_TIP, hl.MIDDLE_FINGER_PIP),
+            is_finger_extended(hl.RING_FINGER_TIP, hl.RING_FINGER_PIP),
+            is_finger_extended(hl.PINKY_TIP, hl.PINKY_PIP),
+        ]
+        return gesture_from_finger_count(sum(fingers_extended))
+
+    def _close(self):
+        self._hands.close()
+        self._hands = None
+
+
+BACKENDS = {
+    "hull": HullBackend,
+    "mediapipe": MediaPipeBackend,
+}
@@ -1,12 +1,13 @@
 import gi
 import time
 import numpy as np
-import cv2
-import math
+
+from hand_segmentation import SEGMENTERS
+from gesture_backends import BACKENDS, GESTURE_NAMES, HullBackend
 
 gi.require_version("Gst", "1.0")
 gi.require_version("GstBase", "1.0")
-from gi.repository import Gst, GstBase, GObject
+from gi.repository import Gst, GstBase, GObject, GLib
 
 CAPS_STR = "video/x-raw, format=(string)RGB, width=(int)[1, 2147483647], height=(int)[1, 2147483647], framerate=(fraction)[0/1, 2147483647/1]"
 
@@ -15,7 +16,7 @@ class GestureRecognizer(GstBase.BaseTransform):
     __gstmetadata__ = (
         "Hand Gesture Recognizer",
         "Filter/Effect/Video",
-        "Detects hand gestures using OpenCV Convex Hull and convexity defects",
+        "Detects hand gestures using OpenCV Convex Hull or MediaPipe Hands",
         "Konstantine Nebieridze 12",
     )
 
@@ -38,22 +39,84 @@ class GestureRecognizer(GstBase.BaseTransform):
         ),
     )
 
+    __gproperties__ = {
+        "cooldown": (
+            float,
+            "Cooldown",
+            "Minimum seconds between two gesture messages",
+            0.0,
+            60.0,
+            1.0,
+            GObject.ParamFlags.READWRITE,
+        ),
+        "segmenter": (
+            str,
+            "Segmenter",
+            "Hand segmentation engine for the hull backend: otsu or skin-lut",
+            "otsu",
+            GObject.ParamFlags.READWRITE,
+        ),
+        "backend": (
+            str,
+            "Backend",
+            "Gesture recognition backend: hull or mediapipe",
+            "hull",
+            GObject.ParamFlags.READWRITE,
+        ),
+        "stats": (
+            str,
+            "Stats",
+            "Per-backend statistics serialized as a GstStructure",
+            "",
+            GObject.ParamFlags.READABLE,
+        ),
+    }
+
     def __init__(self):
         super().__init__()
         self.cooldown = 1.0
+        self.segmenter = "otsu"
+        self.backend = "hull"
+        self._backend = self._make_backend()
+        self._started = False
         self.last_gesture_id = 0
         self.last_emit_time = 0.0
         self.width = 0
         self.height = 0
+        # Frames are only read, so never make the buffer writable (no copies)
+        self.set_passthrough(True)
 
     def do_get_property(self, prop):
         if prop.name == "cooldown":
             return self.cooldown
+        if prop.name == "segmenter":
+            return self.segmenter
+        if prop.name == "backend":
+            return self.backend
+        if prop.name == "stats":
+            return self._stats_structure().to_string()
         raise AttributeError("Unknown property")
 
     def do_set_property(self, prop, value):
         if prop.name == "cooldown":
             self.cooldown = value
+        elif prop.name == "segmenter":
+            if value not in SEGMENTERS:
+                Gst.warning(f"Unknown segmenter '{value}', keeping '{self.segmenter}'")
+                return
+            self.segmenter = value
+            if self.backend == "hull":
+                self._backend.segmenter = value
+        elif prop.name == "backend":
+            if value not in BACKENDS:
+                Gst.warning(f"Unknown backend '{value}', keeping '{self.backend}'")
+                return
+            if self._started:
+                Gst.warning("backend can only be changed while the element is stopped")
+                return
+            self._backend.close()
+            self.backend = value
+            self._backend = self._make_backend()
         else:
             raise AttributeError("Unknown property")
 
@@ -63,59 +126,43 @@ class GestureRecognizer(GstBase.BaseTransform):
         self.height = s.get_value("height")
         return True
 
+    def _make_backend(self):
+        if self.backend == "hull":
+            return HullBackend(segmenter=self.segmenter)
+        return BACKENDS[self.backend]()
+
+    def do_start(self):
+        # Load the model when the pipeline starts rather than on the first frame
+        try:
+            self._backend.load()
+        except Exception as e:
+            err = GLib.Error.new_literal(
+                Gst.library_error_quark(),
+                f"Failed to load {self.backend} backend",
+                Gst.LibraryError.INIT,
+            )
+            self.post_message(Gst.Message.new_error(self, err, str(e)))
+            return False
+        self._started = True
+        return True
+
+    def do_stop(self):
+        Gst.info(self._stats_structure().to_string())
+        self._backend.close()
+        self._started = False
+        return True
+
+    def _stats_structure(self):
+        s = Gst.Structure.new_empty("gesture-stats")
+        for key, value in self._backend.stats().items():
+            s.set_value(key, value)
+        return s
+
     def _get_gesture_id(self, frame):
-        # Convert RGB to Gray (GStreamer usually sends RGB)
-        gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-        blur = cv2.GaussianBlur(gray, (35, 35), 0)
-        
-        # Threshold to find hand (adjust if background is light)
-        _, thresh = cv2.threshold(blur, 127, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-        
-        contours, _ = cv2.findContours(thresh, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
-        if not contours:
-            return 0
-            
-        cnt = max(contours, key=lambda x: cv2.contourArea(x))
-        if cv2.contourArea(cnt) < 5000:
-            return 0
-
-        hull_points = cv2.convexHull(cnt)
-        hull_indices = cv2.convexHull(cnt, returnPoints=False)
-        
-        # We need at least 3 points for defects
-        if len(hull_indices) < 3:
-            return 0
-
-        defects = cv2.convexityDefects(cnt, hull_indices)
-        if defects is None:
-            return 1 # Fist
-
-        count_defects = 0
-        for i in range(defects.shape[0]):
-            s, e, f, d = defects[i, 0]
-            start = tuple(cnt[s][0])
-            end = tuple(cnt[e][0])
-            far = tuple(cnt[f][0])
-
-            a = math.sqrt((end[0] - start[0])**2 + (end[1] - start[1])**2)
-            b = math.sqrt((far[0] - start[0])**2 + (far[1] - start[1])**2)
-            c = math.sqrt((end[0] - far[0])**2 + (end[1] - far[1])**2)
-            angle = math.acos((b**2 + c**2 - a**2) / (2*b*c)) * 57
-
-            # Deep defects (valleys between fingers) usually have small angles
-            if angle <= 90 and d > 1000: 
-                count_defects += 1
-
-        # Logic: N defects = N+1 fingers
-        if count_defects == 0: return 1 # Fist
-        if count_defects == 1: return 2 # Index/V
-        if count_defects == 2: return 3 # Three fingers
-        if count_defects == 3: return 4 # Four fingers
-        if count_defects == 4: return 5 # Open Palm
-        return 0
+        return self._backend.process(frame)
 
     def do_transform_ip(self, buffer):
-        ok, map_info = buffer.map(Gst.MapFlags.READ | Gst.MapFlags.WRITE)
+        ok, map_info = buffer.map(Gst.MapFlags.READ)
         if not ok:
             return Gst.FlowReturn.OK
 
@@ -145,6 +192,8 @@ class GestureRecognizer(GstBase.BaseTransform):
         if bus:
             s = Gst.Structure.new_empty("gesture")
             s.set_value("id", gesture_id)
+            s.set_value("name", GESTURE_NAMES.get(gesture_id, ""))
+            s.set_value("backend", self.backend)
             msg = Gst.Message.new_element(self, s)
             bus.post(msg)
 
@@ -0,0 +1,162 @@
+import os
+import math
+import hashlib
+import tempfile
+import numpy as np
+import cv2
+
+# Skin-color LUT: RGB is quantized to LUT_BITS per channel and every bin is
+# classified once in YCrCb space, so per-frame segmentation is a single table
+# lookup instead of a color conversion + blur + Otsu pass.
+LUT_BITS = 5
+LUT_SHIFT = 8 - LUT_BITS
+LUT_SIZE = 1 << LUT_BITS
+
+# Classic chroma bounds for skin (Chai & Ngan); Y floor rejects dark noise
+SKIN_Y_MIN = 40
+SKIN_CR_RANGE = (133, 173)
+SKIN_CB_RANGE = (77, 127)
+
+MIN_HAND_AREA = 5000
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "gesture_recognizer",
+)
+
+_MORPH_KERNEL = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+_skin_lut = None
+
+
+def build_skin_lut():
+    # Bin centers for every quantized RGB triple, laid out as one image row
+    centers = (np.arange(LUT_SIZE, dtype=np.uint16) << LUT_SHIFT) + (1 << LUT_SHIFT) // 2
+    r, g, b = np.meshgrid(centers, centers, centers, indexing="ij")
+    rgb = np.stack([r, g, b], axis=-1).astype(np.uint8).reshape(1, -1, 3)
+
+    ycrcb = cv2.cvtColor(rgb, cv2.COLOR_RGB2YCrCb).reshape(-1, 3)
+    y, cr, cb = ycrcb[:, 0], ycrcb[:, 1], ycrcb[:, 2]
+    skin = (
+        (y >= SKIN_Y_MIN)
+        & (cr >= SKIN_CR_RANGE[0]) & (cr <= SKIN_CR_RANGE[1])
+        & (cb >= SKIN_CB_RANGE[0]) & (cb <= SKIN_CB_RANGE[1])
+    )
+    # Stored as 0/255 so the lookup result is directly a binary mask
+    return np.where(skin, 255, 0).astype(np.uint8)
+
+
+def _skin_lut_path():
+    # Key the cache on everything that shapes the table so retuned bounds rebuild it
+    params = repr((LUT_BITS, SKIN_Y_MIN, SKIN_CR_RANGE, SKIN_CB_RANGE))
+    digest = hashlib.sha1(params.encode()).hexdigest()[:10]
+    return os.path.join(CACHE_DIR, f"skin_lut_{LUT_BITS}bit_{digest}.npy")
+
+
+def _save_skin_lut(path, lut):
+    # np.save is not atomic; write a temp file and swap it in so an
+    # interrupted write never leaves a truncated table behind
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".npy.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, lut)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load_skin_lut():
+    global _skin_lut
+    if _skin_lut is not None:
+        return _skin_lut
+
+    path = _skin_lut_path()
+    try:
+        lut = np.load(path)
+        if lut.shape != (LUT_SIZE ** 3,) or lut.dtype != np.uint8:
+            raise ValueError("stale LUT cache")
+    except (OSError, ValueError, EOFError):
+        lut = build_skin_lut()
+        try:
+            _save_skin_lut(path, lut)
+        except OSError:
+            pass  # Read-only home: keep the in-memory table only
+
+    _skin_lut = lut
+    return lut
+
+
+def segment_otsu(frame):
+    # Convert RGB to Gray (GStreamer usually sends RGB)
+    gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+    blur = cv2.GaussianBlur(gray, (35, 35), 0)
+
+    # Threshold to find hand (adjust if background is light)
+    _, thresh = cv2.threshold(blur, 127, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    return thresh
+
+
+def segment_skin_lut(frame):
+    lut = load_skin_lut()
+    q = (frame >> LUT_SHIFT).astype(np.uint16)
+    index = (q[..., 0] << (2 * LUT_BITS)) | (q[..., 1] << LUT_BITS) | q[..., 2]
+    mask = lut[index]
+
+    # Small open/close replaces the 35x35 blur: drop speckles, fill pinholes
+    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, _MORPH_KERNEL)
+    mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, _MORPH_KERNEL)
+    return mask
+
+
+SEGMENTERS = {
+    "otsu": segment_otsu,
+    "skin-lut": segment_skin_lut,
+}
+
+
+def gesture_from_mask(mask):
+    contours, _ = cv2.findContours(mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
+    if not contours:
+        return 0
+
+    cnt = max(contours, key=lambda x: cv2.contourArea(x))
+    if cv2.contourArea(cnt) < MIN_HAND_AREA:
+        return 0
+
+    hull_indices = cv2.convexHull(cnt, returnPoints=False)
+
+    # We need at least 3 points for defects
+    if len(hull_indices) < 3:
+        return 0
+
+    defects = cv2.convexityDefects(cnt, hull_indices)
+    if defects is None:
+        return 1 # Fist
+
+    count_defects = 0
+    for i in range(defects.shape[0]):
+        s, e, f, d = defects[i, 0]
+        start = tuple(cnt[s][0])
+        end = tuple(cnt[e][0])
+        far = tuple(cnt[f][0])
+
+        a = math.sqrt((end[0] - start[0])**2 + (end[1] - start[1])**2)
+        b = math.sqrt((far[0] - start[0])**2 + (far[1] - start[1])**2)
+        c = math.sqrt((end[0] - far[0])**2 + (end[1] - far[1])**2)
+        angle = math.acos((b**2 + c**2 - a**2) / (2*b*c)) * 57
+
+        # Deep defects (valleys between fingers) usually have small angles
+        if angle <= 90 and d > 1000:
+            count_defects += 1
+
+    # Logic: N defects = N+1 fingers
+    if count_defects == 0: return 1 # Fist
+    if count_defects == 1: return 2 # Index/V
+    if count_defects == 2: return 3 # Three fingers
+    if count_defects == 3: return 4 # Four fingers
+    if count_defects == 4: return 5 # Open Palm
+    return 0
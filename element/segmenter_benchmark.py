@@ -0,0 +1,150 @@
+import os
+import sys
+import csv
+import time
+import argparse
+import numpy as np
+import cv2
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugin"))
+from hand_segmentation import SEGMENTERS, load_skin_lut, gesture_from_mask
+
+FRAME_WIDTH = 640
+FRAME_HEIGHT = 480
+
+SKIN_TONES = [(224, 172, 140), (198, 134, 66), (141, 85, 36)]
+BACKGROUNDS = {
+    "dark": (30, 30, 35),
+    "light": (235, 235, 230),
+    "gray": (120, 125, 130),
+}
+
+
+def create_log_filename(prefix):
+    ts = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    return f"{prefix}_{ts}.csv"
+
+def log_setup(filename):
+    f = open(filename, "w", newline="")
+    writer = csv.writer(f)
+    writer.writerow([
+        "timestamp", "frame", "source", "engine",
+        "segment_ms", "total_ms", "gesture_id", "expected_id"
+    ])
+    return f, writer
+
+
+def synthetic_hand(fingers, skin, background, rng):
+    frame = np.empty((FRAME_HEIGHT, FRAME_WIDTH, 3), dtype=np.uint8)
+    frame[:] = background
+
+    cx, cy = FRAME_WIDTH // 2, FRAME_HEIGHT // 2 + 60
+    cv2.ellipse(frame, (cx, cy), (80, 95), 0, 0, 360, skin, -1)
+
+    # Fingers fan out over the top of the palm
+    spread = np.linspace(-60, 60, fingers) if fingers > 1 else [0]
+    for deg in spread:
+        rad = np.deg2rad(deg - 90)
+        tip = (int(cx + 190 * np.cos(rad)), int(cy + 190 * np.sin(rad)))
+        cv2.line(frame, (cx, cy), tip, skin, 26)
+
+    noise = rng.normal(0, 6, frame.shape)
+    frame = np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+    # N fingers -> N-1 valleys; a single finger has none and reads as a fist
+    expected = max(fingers, 1)
+    return frame, expected
+
+def synthetic_frames(repeat, seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(repeat):
+        for bg_name, bg in BACKGROUNDS.items():
+            for skin in SKIN_TONES:
+                for fingers in range(1, 6):
+                    frame, expected = synthetic_hand(fingers, skin, bg, rng)
+                    yield f"synthetic-{bg_name}", frame, expected
+
+def video_frames(path):
+    cap = cv2.VideoCapture(path)
+    try:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frame = cv2.resize(frame, (FRAME_WIDTH, FRAME_HEIGHT))
+            yield os.path.basename(path), cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), 0
+    finally:
+        cap.release()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare gesture_recognizer segmentation engines")
+    parser.add_argument("--video", help="recorded clip to use instead of synthetic frames")
+    parser.add_argument("--repeat", type=int, default=5, help="passes over the synthetic set")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Table build/load is a one-off cost, keep it out of the per-frame numbers
+    start = time.perf_counter()
+    load_skin_lut()
+    print(f"Skin LUT ready in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    frames = video_frames(args.video) if args.video else synthetic_frames(args.repeat, args.seed)
+
+    log_filename = create_log_filename("segmenter_log")
+    log_file, logger = log_setup(log_filename)
+    print(f"Logging to: {log_filename}")
+
+    stats = {name: {"segment_ms": [], "total_ms": [], "correct": 0} for name in SEGMENTERS}
+    agree = 0
+    labelled = 0
+    frame_id = 0
+
+    try:
+        for source, frame, expected in frames:
+            ids = {}
+            for name, segment in SEGMENTERS.items():
+                t0 = time.perf_counter()
+                mask = segment(frame)
+                t1 = time.perf_counter()
+                gesture_id = gesture_from_mask(mask)
+                t2 = time.perf_counter()
+
+                ids[name] = gesture_id
+                stats[name]["segment_ms"].append((t1 - t0) * 1000)
+                stats[name]["total_ms"].append((t2 - t0) * 1000)
+                if expected and gesture_id == expected:
+                    stats[name]["correct"] += 1
+
+                logger.writerow([
+                    datetime.now().isoformat(), frame_id, source, name,
+                    round((t1 - t0) * 1000, 3), round((t2 - t0) * 1000, 3),
+                    gesture_id, expected
+                ])
+
+            if len(set(ids.values())) == 1:
+                agree += 1
+            if expected:
+                labelled += 1
+            frame_id += 1
+    finally:
+        log_file.close()
+
+    if frame_id == 0:
+        print("No frames processed.")
+        return
+
+    print(f"\nFrames: {frame_id}")
+    for name, s in stats.items():
+        line = (f"{name:>9}: segment {np.mean(s['segment_ms']):7.2f} ms "
+                f"(p95 {np.percentile(s['segment_ms'], 95):.2f})  "
+                f"total {np.mean(s['total_ms']):7.2f} ms")
+        if labelled:
+            line += f"  accuracy {100 * s['correct'] / labelled:5.1f}%"
+        print(line)
+    print(f"Engine agreement: {100 * agree / frame_id:.1f}%")
+
+
+if __name__ == "__main__":
+    main()